@@ -1,8 +1,24 @@
+from sqlalchemy import delete, insert, tuple_
 from sqlalchemy.orm import Session
-from . import models, schemas
+from . import models, schemas, search
 
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER (3.32+); statements that bind
+# one parameter per item are split so they stay below it.
+SQLITE_MAX_VARIABLES = 32766
 
-def get_courses(db: Session, skip: int = 0, limit: int = 10, filters: dict = None):
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def get_courses(
+    db: Session,
+    skip: int = 0,
+    limit: int = 10,
+    filters: dict = None,
+    after_id: int = None,
+):
     query = db.query(models.Course)
     if filters:
         if "subject" in filters:
@@ -19,7 +35,14 @@ def get_courses(db: Session, skip: int = 0, limit: int = 10, filters: dict = Non
             query = query.filter(
                 models.Course.description.ilike(f"%{filters['description']}%")
             )
-    return query.offset(skip).limit(limit).all()
+        if "q" in filters:
+            query = search.apply_search(query, filters["q"])
+    if after_id is not None:
+        # Keyset pagination: seek past the previous page on the primary key
+        # instead of scanning and discarding `skip` rows.
+        query = query.filter(models.Course.id > after_id)
+        skip = 0
+    return query.order_by(models.Course.id).offset(skip).limit(limit).all()
 
 
 def get_course_by_id(db: Session, course_id: int):
@@ -52,13 +75,48 @@ def create_course(db: Session, course: schemas.CourseCreate):
     return db_course
 
 
+def find_duplicate_courses(db: Session, courses: list[schemas.CourseCreate]):
+    """Return the items of `courses` whose (subject, courseNumber) is taken.
+
+    A key is taken if it already exists in the database or appears earlier in
+    the same payload. Existing keys are looked up with one set-based query
+    (per chunk of SQLITE_MAX_VARIABLES) instead of one query per item.
+    """
+    keys = list({(course.subject, course.courseNumber) for course in courses})
+    existing = set()
+    for chunk in _chunks(keys, SQLITE_MAX_VARIABLES // 2):
+        existing.update(
+            db.query(models.Course.subject, models.Course.courseNumber)
+            .filter(
+                tuple_(models.Course.subject, models.Course.courseNumber).in_(chunk)
+            )
+            .all()
+        )
+
+    duplicates = []
+    seen = set()
+    for course in courses:
+        key = (course.subject, course.courseNumber)
+        if key in existing or key in seen:
+            duplicates.append(course)
+        seen.add(key)
+    return duplicates
+
+
 def create_courses(db: Session, courses: list[schemas.CourseCreate]):
-    db_courses = [models.Course(**course.dict()) for course in courses]
-    db.add_all(db_courses)
+    """Insert `courses` with multi-row INSERT ... RETURNING statements.
+
+    The created rows are returned as plain result rows, so no per-row refresh
+    is needed after the commit. Ids are assigned in insertion order, so sorting
+    on them restores payload order without forcing SQLAlchemy to fall back to
+    row-at-a-time inserts (which `sort_by_parameter_order` does on SQLite).
+    """
+    if not courses:
+        return []
+    statement = insert(models.Course).returning(*models.Course.__table__.c)
+    rows = db.execute(statement, [course.model_dump() for course in courses]).all()
     db.commit()
-    for db_course in db_courses:
-        db.refresh(db_course)
-    return db_courses
+    return sorted(rows, key=lambda row: row.id)
 
 
 def update_course(db: Session, course_id: int, course: schemas.CourseUpdate):
@@ -81,11 +139,25 @@ def delete_course(db: Session, course_id: int):
     return db_course
 
 
-def delete_multiple_courses(db: Session, course_ids: list[int]):
-    courses_to_delete = (
-        db.query(models.Course).filter(models.Course.id.in_(course_ids)).all()
-    )
-    for db_course in courses_to_delete:
-        db.delete(db_course)
+def delete_multiple_courses(db: Session, course_ids: list[int], ids_only: bool = False):
+    """Delete courses with `DELETE ... WHERE id IN (...) RETURNING ...`.
+
+    Nothing is loaded into the session: each chunk of ids is one statement and
+    the deleted rows (or just their ids with `ids_only`) come back from
+    RETURNING.
+    """
+    columns = (models.Course.id,) if ids_only else tuple(models.Course.__table__.c)
+    unique_ids = list(dict.fromkeys(course_ids))
+    deleted = []
+    for chunk in _chunks(unique_ids, SQLITE_MAX_VARIABLES):
+        statement = (
+            delete(models.Course)
+            .where(models.Course.id.in_(chunk))
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+        deleted.extend(db.execute(statement).all())
     db.commit()
-    return courses_to_delete
+    if ids_only:
+        return [row.id for row in deleted]
+    return deleted
@@ -0,0 +1,28 @@
+import base64
+import binascii
+import json
+
+# Cursors are opaque to clients: a urlsafe base64 JSON document holding the
+# sort key of the last row on the previous page. Only `id` ordering is keyed
+# today; the version field lets the format evolve without breaking crawlers.
+CURSOR_VERSION = 1
+
+
+def encode_cursor(last_id: int) -> str:
+    payload = json.dumps({"v": CURSOR_VERSION, "id": last_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return the id encoded in `cursor`, raising ValueError if it is malformed."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(payload, dict) or payload.get("v") != CURSOR_VERSION:
+        raise ValueError("Invalid cursor")
+    last_id = payload.get("id")
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
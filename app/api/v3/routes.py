@@ -1,6 +1,8 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
 from sqlalchemy.orm import Session
+from typing import Union
 from . import crud, schemas, models
+from .pagination import decode_cursor, encode_cursor
 from .database import get_db
 
 router = APIRouter()
@@ -24,14 +26,7 @@ def create_course(course: schemas.CourseCreate, db: Session = Depends(get_db)):
     status_code=status.HTTP_201_CREATED,
 )
 def create_courses(courses: list[schemas.CourseCreate], db: Session = Depends(get_db)):
-    duplicates = []
-
-    for course in courses:
-        existing_course = crud.get_course_by_subject_and_number(
-            db, subject=course.subject, courseNumber=course.courseNumber
-        )
-        if existing_course:
-            duplicates.append(course)
+    duplicates = crud.find_duplicate_courses(db, courses=courses)
 
     if duplicates:
         raise HTTPException(
@@ -44,13 +39,27 @@ def create_courses(courses: list[schemas.CourseCreate], db: Session = Depends(ge
 
 @router.get("/courses/", response_model=list[schemas.Course])
 def get_courses(
+    response: Response,
     subject: str = Query(None),
     courseNumber: str = Query(None),
     instructor: str = Query(None),
+    q: str = Query(None),
     skip: int = 0,
     limit: int = 10,
+    cursor: str = Query(None),
     db: Session = Depends(get_db),
 ):
+    after_id = None
+    if cursor:
+        if q:
+            raise HTTPException(
+                status_code=400, detail="Cursor pagination is not supported with q"
+            )
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     filters = {}
     if subject:
         filters["subject"] = subject
@@ -58,10 +67,16 @@ def get_courses(
         filters["courseNumber"] = courseNumber
     if instructor:
         filters["instructor"] = instructor
+    if q:
+        filters["q"] = q
 
-    courses = crud.get_courses(db, skip=skip, limit=limit, filters=filters)
+    courses = crud.get_courses(
+        db, skip=skip, limit=limit, filters=filters, after_id=after_id
+    )
     if not courses:
         raise HTTPException(status_code=404, detail="Courses not found")
+    if not q and len(courses) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(courses[-1].id)
     return courses
 
 
@@ -93,10 +108,22 @@ def delete_course(course_id: int, db: Session = Depends(get_db)):
     return crud.delete_course(db=db, course_id=course_id)
 
 
-@router.delete("/courses/batch/")
-def delete_multiple_courses(course_ids: dict, db: Session = Depends(get_db)):
-    ids = course_ids.get("course_ids", [])
-    deleted_courses = crud.delete_multiple_courses(db=db, course_ids=ids)
-    if not deleted_courses:
+@router.delete(
+    "/courses/batch/",
+    response_model=Union[
+        schemas.CourseBatchDeleteResult, schemas.CourseBatchDeleteIds
+    ],
+)
+def delete_multiple_courses(
+    batch: schemas.CourseBatchDelete,
+    ids_only: bool = False,
+    db: Session = Depends(get_db),
+):
+    deleted = crud.delete_multiple_courses(
+        db=db, course_ids=batch.course_ids, ids_only=ids_only
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="No courses found to delete")
-    return {"deleted_courses": deleted_courses}
+    if ids_only:
+        return {"deleted_ids": deleted}
+    return {"deleted_courses": deleted}
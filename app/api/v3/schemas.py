@@ -65,3 +65,15 @@ class Course(CourseBase):
 
     class Config:
         from_attributes = True
+
+
+class CourseBatchDelete(BaseModel):
+    course_ids: list[int] = []
+
+
+class CourseBatchDeleteResult(BaseModel):
+    deleted_courses: list[Course]
+
+
+class CourseBatchDeleteIds(BaseModel):
+    deleted_ids: list[int]
@@ -0,0 +1,116 @@
+import re
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, event, false, func
+from sqlalchemy import literal_column, text
+from . import models
+
+# External-content FTS5 index over `courses.description`. It lives in its own
+# MetaData so `Base.metadata.create_all` never tries to create it as a plain
+# table; its lifecycle is tied to the `courses` table through the DDL events
+# registered at the bottom of this module.
+FTS_TABLE_NAME = "courses_fts"
+
+courses_fts = Table(
+    FTS_TABLE_NAME,
+    MetaData(),
+    Column("rowid", Integer, primary_key=True),
+    Column("description", String),
+)
+
+_CREATE_STATEMENTS = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE_NAME} USING fts5(
+        description,
+        content='courses',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_ai AFTER INSERT ON courses BEGIN
+        INSERT INTO {FTS_TABLE_NAME}(rowid, description)
+        VALUES (new.id, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_ad AFTER DELETE ON courses BEGIN
+        INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}, rowid, description)
+        VALUES ('delete', old.id, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE_NAME}_au
+    AFTER UPDATE OF description ON courses BEGIN
+        INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}, rowid, description)
+        VALUES ('delete', old.id, old.description);
+        INSERT INTO {FTS_TABLE_NAME}(rowid, description)
+        VALUES (new.id, new.description);
+    END
+    """,
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def create_search_index(connection, rebuild: bool = False):
+    """Create the FTS5 table and its sync triggers if they are missing.
+
+    The index is rebuilt from `courses` when it is created for the first time
+    (e.g. an existing database file) or when `rebuild` is requested.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE_NAME},
+    ).first()
+    for statement in _CREATE_STATEMENTS:
+        connection.exec_driver_sql(statement)
+    if rebuild or exists is None:
+        connection.exec_driver_sql(
+            f"INSERT INTO {FTS_TABLE_NAME}({FTS_TABLE_NAME}) VALUES ('rebuild')"
+        )
+
+
+def drop_search_index(connection):
+    if connection.dialect.name != "sqlite":
+        return
+    connection.exec_driver_sql(f"DROP TABLE IF EXISTS {FTS_TABLE_NAME}")
+
+
+def build_match_expression(query_text: str):
+    """Turn free text into an FTS5 query of quoted prefix tokens.
+
+    Every token must match (implicit AND) and the last characters typed are
+    treated as a prefix, so "intro bio" matches "Introduction to Biology".
+    Returns None when the text contains no searchable tokens.
+    """
+    tokens = _TOKEN_RE.findall(query_text or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def apply_search(query, query_text: str):
+    """Restrict an ORM query on `Course` to FTS matches, best match first."""
+    match = build_match_expression(query_text)
+    if match is None:
+        return query.filter(false())
+    fts = literal_column(FTS_TABLE_NAME)
+    return (
+        query.join(courses_fts, courses_fts.c.rowid == models.Course.id)
+        .filter(fts.op("MATCH")(match))
+        .order_by(func.bm25(fts), models.Course.id)
+    )
+
+
+@event.listens_for(models.Course.__table__, "after_create")
+def _create_search_index_after_courses(target, connection, **kw):
+    # A freshly created `courses` table is empty, but an FTS table left behind
+    # by an older schema may still hold stale rowids, so always rebuild.
+    create_search_index(connection, rebuild=True)
+
+
+@event.listens_for(models.Course.__table__, "after_drop")
+def _drop_search_index_after_courses(target, connection, **kw):
+    drop_search_index(connection)
@@ -0,0 +1 @@
+# Initialize the v4 package
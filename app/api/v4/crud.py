@@ -0,0 +1,126 @@
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.v3 import models, schemas, search
+from app.api.v3.crud import SQLITE_MAX_VARIABLES, _chunks
+
+# Async equivalents of `app.api.v3.crud`, operating on the same table.
+
+
+async def get_courses(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 10,
+    filters: dict = None,
+    after_id: int = None,
+):
+    query = select(models.Course)
+    if filters:
+        if "subject" in filters:
+            query = query.filter(models.Course.subject == filters["subject"])
+        if "courseNumber" in filters:
+            query = query.filter(models.Course.courseNumber == filters["courseNumber"])
+        if "instructor" in filters:
+            query = query.filter(models.Course.instructor == filters["instructor"])
+        if "credits" in filters:
+            query = query.filter(models.Course.credits == filters["credits"])
+        if "semester" in filters:
+            query = query.filter(models.Course.semester == filters["semester"])
+        if "description" in filters:
+            query = query.filter(
+                models.Course.description.ilike(f"%{filters['description']}%")
+            )
+        if "q" in filters:
+            query = search.apply_search(query, filters["q"])
+    if after_id is not None:
+        query = query.filter(models.Course.id > after_id)
+        skip = 0
+    query = query.order_by(models.Course.id).offset(skip).limit(limit)
+    return (await db.scalars(query)).all()
+
+
+async def get_course_by_id(db: AsyncSession, course_id: int):
+    return await db.get(models.Course, course_id)
+
+
+async def get_course_by_subject_and_number(
+    db: AsyncSession, subject: str, courseNumber: str
+):
+    query = select(models.Course).filter(
+        models.Course.subject == subject, models.Course.courseNumber == courseNumber
+    )
+    return (await db.scalars(query)).first()
+
+
+async def create_course(db: AsyncSession, course: schemas.CourseCreate):
+    db_course = models.Course(**course.model_dump())
+    db.add(db_course)
+    await db.commit()
+    return db_course
+
+
+async def find_duplicate_courses(db: AsyncSession, courses: list[schemas.CourseCreate]):
+    keys = list({(course.subject, course.courseNumber) for course in courses})
+    existing = set()
+    for chunk in _chunks(keys, SQLITE_MAX_VARIABLES // 2):
+        query = select(models.Course.subject, models.Course.courseNumber).filter(
+            tuple_(models.Course.subject, models.Course.courseNumber).in_(chunk)
+        )
+        existing.update((await db.execute(query)).all())
+
+    duplicates = []
+    seen = set()
+    for course in courses:
+        key = (course.subject, course.courseNumber)
+        if key in existing or key in seen:
+            duplicates.append(course)
+        seen.add(key)
+    return duplicates
+
+
+async def create_courses(db: AsyncSession, courses: list[schemas.CourseCreate]):
+    if not courses:
+        return []
+    statement = insert(models.Course).returning(*models.Course.__table__.c)
+    result = await db.execute(statement, [course.model_dump() for course in courses])
+    rows = result.all()
+    await db.commit()
+    return sorted(rows, key=lambda row: row.id)
+
+
+async def update_course(db: AsyncSession, course_id: int, course: schemas.CourseUpdate):
+    db_course = await get_course_by_id(db, course_id)
+    if db_course is None:
+        return None
+    for key, value in course.model_dump(exclude_unset=True).items():
+        setattr(db_course, key, value)
+    await db.commit()
+    return db_course
+
+
+async def delete_course(db: AsyncSession, course_id: int):
+    db_course = await get_course_by_id(db, course_id)
+    if db_course is None:
+        return None
+    await db.delete(db_course)
+    await db.commit()
+    return db_course
+
+
+async def delete_multiple_courses(
+    db: AsyncSession, course_ids: list[int], ids_only: bool = False
+):
+    columns = (models.Course.id,) if ids_only else tuple(models.Course.__table__.c)
+    unique_ids = list(dict.fromkeys(course_ids))
+    deleted = []
+    for chunk in _chunks(unique_ids, SQLITE_MAX_VARIABLES):
+        statement = (
+            delete(models.Course)
+            .where(models.Course.id.in_(chunk))
+            .returning(*columns)
+            .execution_options(synchronize_session=False)
+        )
+        deleted.extend((await db.execute(statement)).all())
+    await db.commit()
+    if ids_only:
+        return [row.id for row in deleted]
+    return deleted
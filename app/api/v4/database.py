@@ -0,0 +1,6 @@
+from app.database import (
+    ASYNC_DATABASE_URL as SQLALCHEMY_DATABASE_URL,
+    AsyncSessionLocal,
+    async_engine as engine,
+    get_async_db as get_db,
+)
@@ -0,0 +1,134 @@
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Union
+from app.api.v3 import schemas
+from app.api.v3.pagination import decode_cursor, encode_cursor
+from . import crud
+from .database import get_db
+
+router = APIRouter()
+
+
+@router.post(
+    "/courses/", response_model=schemas.Course, status_code=status.HTTP_201_CREATED
+)
+async def create_course(
+    course: schemas.CourseCreate, db: AsyncSession = Depends(get_db)
+):
+    db_course = await crud.get_course_by_subject_and_number(
+        db, subject=course.subject, courseNumber=course.courseNumber
+    )
+    if db_course:
+        raise HTTPException(status_code=400, detail="Course already exists")
+    return await crud.create_course(db=db, course=course)
+
+
+@router.post(
+    "/courses/batch/",
+    response_model=list[schemas.Course],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_courses(
+    courses: list[schemas.CourseCreate], db: AsyncSession = Depends(get_db)
+):
+    duplicates = await crud.find_duplicate_courses(db, courses=courses)
+
+    if duplicates:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Duplicate courses found: {[f'{course.subject} {course.courseNumber}' for course in duplicates]}",
+        )
+
+    return await crud.create_courses(db=db, courses=courses)
+
+
+@router.get("/courses/", response_model=list[schemas.Course])
+async def get_courses(
+    response: Response,
+    subject: str = Query(None),
+    courseNumber: str = Query(None),
+    instructor: str = Query(None),
+    q: str = Query(None),
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str = Query(None),
+    db: AsyncSession = Depends(get_db),
+):
+    after_id = None
+    if cursor:
+        if q:
+            raise HTTPException(
+                status_code=400, detail="Cursor pagination is not supported with q"
+            )
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    filters = {}
+    if subject:
+        filters["subject"] = subject
+    if courseNumber:
+        filters["courseNumber"] = courseNumber
+    if instructor:
+        filters["instructor"] = instructor
+    if q:
+        filters["q"] = q
+
+    courses = await crud.get_courses(
+        db, skip=skip, limit=limit, filters=filters, after_id=after_id
+    )
+    if not courses:
+        raise HTTPException(status_code=404, detail="Courses not found")
+    if not q and len(courses) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(courses[-1].id)
+    return courses
+
+
+@router.get("/courses/{course_id}", response_model=schemas.Course)
+async def get_course(course_id: int, db: AsyncSession = Depends(get_db)):
+    db_course = await crud.get_course_by_id(db, course_id=course_id)
+    if db_course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return db_course
+
+
+@router.put("/courses/{course_id}", response_model=schemas.Course)
+async def update_course(
+    course_id: int,
+    course: schemas.CourseUpdate,
+    db: AsyncSession = Depends(get_db),
+):
+    db_course = await crud.update_course(db=db, course=course, course_id=course_id)
+    if db_course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return db_course
+
+
+@router.delete("/courses/{course_id}", response_model=schemas.Course)
+async def delete_course(course_id: int, db: AsyncSession = Depends(get_db)):
+    db_course = await crud.delete_course(db=db, course_id=course_id)
+    if db_course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return db_course
+
+
+@router.delete(
+    "/courses/batch/",
+    response_model=Union[
+        schemas.CourseBatchDeleteResult, schemas.CourseBatchDeleteIds
+    ],
+)
+async def delete_multiple_courses(
+    batch: schemas.CourseBatchDelete,
+    ids_only: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    deleted = await crud.delete_multiple_courses(
+        db=db, course_ids=batch.course_ids, ids_only=ids_only
+    )
+    if not deleted:
+        raise HTTPException(status_code=404, detail="No courses found to delete")
+    if ids_only:
+        return {"deleted_ids": deleted}
+    return {"deleted_courses": deleted}
@@ -0,0 +1,127 @@
+import os
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Shared data-access layer for every API version. Each process keeps exactly
+# one sync engine (v1-v3) and one async engine (v4) per database, configured
+# through environment variables:
+#
+#   DATABASE_URL            sync SQLAlchemy URL (default sqlite:///./courses.db)
+#   ASYNC_DATABASE_URL      async URL; derived from DATABASE_URL for SQLite
+#   DATABASE_POOL_SIZE      connections kept open in each pool (default 5)
+#   DATABASE_MAX_OVERFLOW   extra connections allowed under load (default 10)
+#   DATABASE_POOL_TIMEOUT   seconds to wait for a free connection (default 30)
+#   SQLITE_PROFILE          pragmas applied on connect: "production" or "none"
+
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./courses.db")
+POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "production")
+
+SQLITE_PROFILES = {
+    # WAL lets readers proceed while a writer commits; synchronous=NORMAL is
+    # durable across application crashes in WAL mode and only risks the last
+    # transactions on power loss.
+    "production": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # negative values are KiB, i.e. 64 MiB
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+    },
+    "none": {},
+}
+
+
+def _async_url(url: str) -> str:
+    parsed = make_url(url)
+    if parsed.drivername in ("sqlite", "sqlite+pysqlite"):
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(
+            hide_password=False
+        )
+    raise ValueError(
+        f"Set ASYNC_DATABASE_URL: no async driver is known for {parsed.drivername}"
+    )
+
+
+def _engine_options(url: str) -> dict:
+    parsed = make_url(url)
+    options = {}
+    if parsed.get_backend_name() == "sqlite":
+        if parsed.database in (None, "", ":memory:"):
+            # In-memory databases live on a single connection; pool sizing
+            # does not apply.
+            return options
+        options["connect_args"] = {"check_same_thread": False}
+    options.update(
+        pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_timeout=POOL_TIMEOUT
+    )
+    return options
+
+
+def apply_sqlite_profile(engine, profile: str = SQLITE_PROFILE):
+    """Run the profile's PRAGMAs on every new DBAPI connection of `engine`."""
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        pragmas = SQLITE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown SQLITE_PROFILE: {profile!r}") from None
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL") or _async_url(
+    SQLALCHEMY_DATABASE_URL
+)
+
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, **_engine_options(SQLALCHEMY_DATABASE_URL)
+)
+apply_sqlite_profile(engine)
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# aiosqlite defaults to NullPool (a new connection and thread per session);
+# pool file-backed databases like the sync engine does.
+_async_engine_options = _engine_options(ASYNC_DATABASE_URL)
+if "pool_size" in _async_engine_options:
+    _async_engine_options["poolclass"] = AsyncAdaptedQueuePool
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_async_engine_options)
+apply_sqlite_profile(async_engine.sync_engine)
+
+# Objects stay usable after commit, so async routes can return them without
+# issuing another (awaited) query to refresh expired attributes.
+AsyncSessionLocal = async_sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=async_engine
+)
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    db = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
@@ -0,0 +1,124 @@
+"""Side-by-side throughput of the sync v3 routes and the async v4 routes.
+
+Runs in-process through httpx's ASGI transport (so v3 handlers go through
+the AnyIO threadpool exactly as under uvicorn), or against a running server
+with --url. The catalog is seeded into a scratch directory so the benchmark
+never touches ./courses.db.
+
+    python benchmarks/async_vs_sync.py --requests 2000 --concurrency 32
+    python benchmarks/async_vs_sync.py --url http://127.0.0.1:8000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SUBJECTS = ["BIO", "CHEM", "MATH", "PHYS", "HIST", "ENG", "CS", "ECON"]
+
+
+def seed_catalog(client_factory, courses: int):
+    payload = [
+        {
+            "subject": SUBJECTS[i % len(SUBJECTS)],
+            "courseNumber": f"{i // len(SUBJECTS) % 1000:03}",
+            "description": f"Course description number {i}",
+            "credits": 1 + i % 5,
+            "instructor": f"Dr. Instructor {i % 50}",
+            "semester": "Fall 2024",
+            "capacity": 30,
+        }
+        for i in range(courses)
+    ]
+
+    async def _seed():
+        async with client_factory() as client:
+            for start in range(0, len(payload), 1000):
+                response = await client.post(
+                    "/v3/courses/batch/", json=payload[start : start + 1000]
+                )
+                response.raise_for_status()
+
+    asyncio.run(_seed())
+
+
+async def run_scenario(client_factory, paths, concurrency: int):
+    latencies = []
+    queue = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    async def worker(client):
+        while True:
+            try:
+                path = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 500:
+                raise RuntimeError(f"{path} failed with {response.status_code}")
+
+    async with client_factory() as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="benchmark a running server instead")
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--versions", nargs="+", default=["v3", "v4"])
+    args = parser.parse_args()
+
+    if args.url:
+        client_factory = lambda: httpx.AsyncClient(base_url=args.url)  # noqa: E731
+    else:
+        os.chdir(tempfile.mkdtemp(prefix="course-bench-"))
+        sys.path.insert(0, ROOT)
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        client_factory = lambda: httpx.AsyncClient(  # noqa: E731
+            transport=transport, base_url="http://bench"
+        )
+        seed_catalog(client_factory, args.courses)
+
+    scenarios = {
+        "point lookup": lambda version, i: f"/{version}/courses/{i % args.courses + 1}",
+        "filtered listing": lambda version, i: (
+            f"/{version}/courses/?subject={SUBJECTS[i % len(SUBJECTS)]}&limit=20"
+        ),
+    }
+
+    print(f"{'scenario':<18} {'version':<8} {'req/s':>10} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, make_path in scenarios.items():
+        for version in args.versions:
+            paths = [make_path(version, i) for i in range(args.requests)]
+            result = asyncio.run(run_scenario(client_factory, paths, args.concurrency))
+            print(
+                f"{name:<18} {version:<8} {result['throughput']:>10.1f}"
+                f" {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -231,3 +231,164 @@ def test_delete_multiple_courses():
 
     get_response2 = client.get(f"/v3/courses/{course_id2}")
     assert get_response2.status_code == 404
+
+
+def test_full_text_search_course_description():
+    client.post(
+        "/v3/courses/batch/",
+        json=[
+            {
+                "subject": "BIO",
+                "courseNumber": "101",
+                "description": "Introduction to Biology",
+            },
+            {
+                "subject": "BIO",
+                "courseNumber": "201",
+                "description": "Molecular Biology and Biology Lab",
+            },
+            {
+                "subject": "CHEM",
+                "courseNumber": "101",
+                "description": "Chemistry I",
+            },
+        ],
+    )
+
+    response = client.get("/v3/courses/?q=biol")
+    assert response.status_code == 200
+    results = response.json()
+    assert [course["courseNumber"] for course in results] == ["201", "101"]
+
+    response = client.get("/v3/courses/?q=intro bio")
+    assert response.status_code == 200
+    assert [course["courseNumber"] for course in response.json()] == ["101"]
+
+    response = client.get("/v3/courses/?q=physics")
+    assert response.status_code == 404
+
+
+def test_full_text_search_follows_updates_and_deletes():
+    response = client.post(
+        "/v3/courses/",
+        json={
+            "subject": "BIO",
+            "courseNumber": "101",
+            "description": "Introduction to Biology",
+        },
+    )
+    course_id = response.json()["id"]
+
+    client.put(f"/v3/courses/{course_id}", json={"description": "Advanced Genetics"})
+    assert client.get("/v3/courses/?q=biology").status_code == 404
+    assert client.get("/v3/courses/?q=genetics").json()[0]["id"] == course_id
+
+    client.delete(f"/v3/courses/{course_id}")
+    assert client.get("/v3/courses/?q=genetics").status_code == 404
+
+
+def test_cursor_pagination():
+    client.post(
+        "/v3/courses/batch/",
+        json=[
+            {
+                "subject": f"SUB{i}",
+                "courseNumber": f"{i:03}",
+                "description": f"Course Description {i}",
+            }
+            for i in range(15)
+        ],
+    )
+
+    first_page = client.get("/v3/courses/?limit=10")
+    assert first_page.status_code == 200
+    assert len(first_page.json()) == 10
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    # Rows inserted mid-scroll must not shift the following page
+    client.post(
+        "/v3/courses/",
+        json={"subject": "NEW", "courseNumber": "999", "description": "Late Addition"},
+    )
+
+    second_page = client.get(f"/v3/courses/?limit=10&cursor={cursor}")
+    assert second_page.status_code == 200
+    ids = [course["id"] for course in first_page.json() + second_page.json()]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 16
+    assert "X-Next-Cursor" not in second_page.headers
+
+
+def test_cursor_pagination_rejects_invalid_cursor():
+    response = client.get("/v3/courses/?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+def test_batch_create_rejects_duplicates_within_payload():
+    course = {
+        "subject": "BIO",
+        "courseNumber": "101",
+        "description": "Introduction to Biology",
+    }
+    response = client.post("/v3/courses/batch/", json=[course, course])
+    assert response.status_code == 400
+    assert "BIO 101" in response.json()["detail"]
+    assert client.get("/v3/courses/").status_code == 404
+
+
+def test_batch_create_returns_rows_in_payload_order():
+    payload = [
+        {
+            "subject": f"SUB{i}",
+            "courseNumber": f"{i:03}",
+            "description": f"Course Description {i}",
+        }
+        for i in range(25)
+    ]
+    response = client.post("/v3/courses/batch/", json=payload)
+    assert response.status_code == 201
+    created = response.json()
+    assert [course["subject"] for course in created] == [
+        course["subject"] for course in payload
+    ]
+    assert all(course["id"] is not None for course in created)
+
+    response = client.post("/v3/courses/batch/", json=payload[:1])
+    assert response.status_code == 400
+
+
+def test_delete_multiple_courses_ids_only():
+    response = client.post(
+        "/v3/courses/batch/",
+        json=[
+            {
+                "subject": f"SUB{i}",
+                "courseNumber": f"{i:03}",
+                "description": f"Course Description {i}",
+            }
+            for i in range(3)
+        ],
+    )
+    ids = [course["id"] for course in response.json()]
+
+    delete_response = client.request(
+        "DELETE",
+        "/v3/courses/batch/?ids_only=true",
+        json={"course_ids": ids + [ids[0], 9999]},
+    )
+    assert delete_response.status_code == 200
+    assert sorted(delete_response.json()["deleted_ids"]) == ids
+    assert client.get("/v3/courses/").status_code == 404
+
+    delete_response = client.request(
+        "DELETE", "/v3/courses/batch/", json={"course_ids": ids}
+    )
+    assert delete_response.status_code == 404
+
+
+def test_delete_multiple_courses_validates_body():
+    response = client.request(
+        "DELETE", "/v3/courses/batch/", json={"course_ids": ["one", "two"]}
+    )
+    assert response.status_code == 422
@@ -0,0 +1,135 @@
+from fastapi.testclient import TestClient
+from app.main import app
+from app.api.v3.database import Base, engine
+import pytest
+
+client = TestClient(app)
+
+
+# Fixture for creating the database and cleaning up after tests
+@pytest.fixture(scope="function", autouse=True)
+def setup_database():
+    # Create the tables
+    Base.metadata.create_all(bind=engine)
+    yield
+    # Drop the tables
+    Base.metadata.drop_all(bind=engine)
+
+
+def test_create_course():
+    response = client.post(
+        "/v4/courses/",
+        json={
+            "subject": "BIO",
+            "courseNumber": "101",
+            "description": "Introduction to Biology",
+            "credits": 3,
+            "instructor": "Dr. Smith",
+            "semester": "Fall 2024",
+            "capacity": 30,
+        },
+    )
+    assert response.status_code == 201
+    assert response.json()["subject"] == "BIO"
+    assert response.json()["id"] is not None
+
+
+def test_create_duplicate_course():
+    course = {
+        "subject": "BIO",
+        "courseNumber": "101",
+        "description": "Introduction to Biology",
+    }
+    client.post("/v4/courses/", json=course)
+    response = client.post("/v4/courses/", json=course)
+    assert response.status_code == 400
+
+
+def test_v4_shares_data_with_v3():
+    response = client.post(
+        "/v3/courses/",
+        json={
+            "subject": "BIO",
+            "courseNumber": "101",
+            "description": "Introduction to Biology",
+            "instructor": "Dr. Smith",
+        },
+    )
+    course_id = response.json()["id"]
+
+    response = client.get(f"/v4/courses/{course_id}")
+    assert response.status_code == 200
+    assert response.json()["instructor"] == "Dr. Smith"
+
+    response = client.get("/v4/courses/?instructor=Dr. Smith&q=biol")
+    assert response.status_code == 200
+    assert [course["id"] for course in response.json()] == [course_id]
+
+
+def test_batch_create_and_cursor_pagination():
+    response = client.post(
+        "/v4/courses/batch/",
+        json=[
+            {
+                "subject": f"SUB{i}",
+                "courseNumber": f"{i:03}",
+                "description": f"Course Description {i}",
+            }
+            for i in range(15)
+        ],
+    )
+    assert response.status_code == 201
+    assert len(response.json()) == 15
+
+    first_page = client.get("/v4/courses/?limit=10")
+    cursor = first_page.headers["X-Next-Cursor"]
+    second_page = client.get(f"/v4/courses/?limit=10&cursor={cursor}")
+    assert second_page.status_code == 200
+    assert len(second_page.json()) == 5
+
+
+def test_update_course():
+    response = client.post(
+        "/v4/courses/",
+        json={
+            "subject": "BIO",
+            "courseNumber": "101",
+            "description": "Introduction to Biology",
+        },
+    )
+    course_id = response.json()["id"]
+
+    update_response = client.put(
+        f"/v4/courses/{course_id}", json={"description": "Advanced Biology"}
+    )
+    assert update_response.status_code == 200
+    assert update_response.json()["description"] == "Advanced Biology"
+
+    response = client.put(
+        "/v4/courses/9999", json={"description": "Advanced Biology"}
+    )
+    assert response.status_code == 404
+
+
+def test_delete_course_and_batch_delete():
+    response = client.post(
+        "/v4/courses/batch/",
+        json=[
+            {
+                "subject": f"SUB{i}",
+                "courseNumber": f"{i:03}",
+                "description": f"Course Description {i}",
+            }
+            for i in range(3)
+        ],
+    )
+    ids = [course["id"] for course in response.json()]
+
+    assert client.delete(f"/v4/courses/{ids[0]}").status_code == 200
+    assert client.get(f"/v4/courses/{ids[0]}").status_code == 404
+
+    delete_response = client.request(
+        "DELETE", "/v4/courses/batch/?ids_only=true", json={"course_ids": ids}
+    )
+    assert delete_response.status_code == 200
+    assert sorted(delete_response.json()["deleted_ids"]) == ids[1:]